@@ -1,6 +1,9 @@
+import asyncio
+import json
 import logging
+from typing import Any, Dict, Optional
 
-import requests
+import aiohttp
 from pydantic import Field
 
 from actions.base import ActionConfig, ActionConnector
@@ -29,6 +32,20 @@ class GPSFabricConnector(ActionConnector[GPSFabricConfig, GPSInput]):
     Connector that shares GPS coordinates via a Fabric network.
     """
 
+    _HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+    # Fail fast on a dead peer instead of waiting out a single long timeout
+    _CONNECT_TIMEOUT = 2.0
+    _READ_TIMEOUT = 8.0
+
+    _MAX_RETRIES = 2
+    _RETRY_BACKOFF = 0.2
+    _RETRY_STATUSES = frozenset({502, 503, 504})
+
+    # Constant JSON-RPC envelope; only the status object is serialized per call
+    _RPC_PREFIX = b'{"method":"omp2p_shareStatus","params":['
+    _RPC_SUFFIX = b'],"id":1,"jsonrpc":"2.0"}'
+
     def __init__(self, config: GPSFabricConfig):
         """
         Initialize the GPSFabricConnector.
@@ -46,6 +63,33 @@ class GPSFabricConnector(ActionConnector[GPSFabricConfig, GPSInput]):
         # Set fabric endpoint configuration
         self.fabric_endpoint = self.config.fabric_endpoint
 
+        # Created lazily so they are bound to the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._pending: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # Only the newest fix is kept; older unsent fixes are dropped
+        self._latest: Optional[Dict[str, Any]] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            Session reusing keep-alive connections to the Fabric endpoint.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=30),
+                headers=self._HEADERS,
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self._CONNECT_TIMEOUT, sock_read=self._READ_TIMEOUT
+                ),
+            )
+        return self._session
+
     async def connect(self, output_interface: GPSInput) -> None:
         """
         Connect to the Fabric network and send GPS coordinates.
@@ -55,13 +99,13 @@ class GPSFabricConnector(ActionConnector[GPSFabricConfig, GPSInput]):
         output_interface : GPSInput
             The GPS input containing the action to be performed.
         """
-        logging.info(f"GPSFabricConnector: {output_interface.action}")
+        logging.info("GPSFabricConnector: %s", output_interface.action)
 
         if output_interface.action == GPSAction.SHARE_LOCATION:
             # Send GPS coordinates to the Fabric network
-            self.send_coordinates()
+            await self.send_coordinates()
 
-    def send_coordinates(self) -> None:
+    async def send_coordinates(self) -> None:
         """
         Send GPS coordinates to the Fabric network.
         """
@@ -69,34 +113,113 @@ class GPSFabricConnector(ActionConnector[GPSFabricConfig, GPSInput]):
         latitude = self.io_provider.get_dynamic_variable("latitude")
         longitude = self.io_provider.get_dynamic_variable("longitude")
         yaw = self.io_provider.get_dynamic_variable("yaw_deg")
-        logging.info(f"GPSFabricConnector: Latitude: {latitude}")
-        logging.info(f"GPSFabricConnector: Longitude: {longitude}")
-        logging.info(f"GPSFabricConnector: Yaw: {yaw}")
+        logging.info("GPSFabricConnector: Latitude: %s", latitude)
+        logging.info("GPSFabricConnector: Longitude: %s", longitude)
+        logging.info("GPSFabricConnector: Yaw: %s", yaw)
 
         if latitude is None and longitude is None and yaw is None:
             # If no coordinates are available, log an error and return
             logging.error("GPSFabricConnector: Coordinates not available.")
             return None
 
-        try:
-            share_status_response = requests.post(
-                f"{self.fabric_endpoint}",
-                json={
-                    "method": "omp2p_shareStatus",
-                    "params": [
-                        {"latitude": latitude, "longitude": longitude, "yaw": yaw}
-                    ],
-                    "id": 1,
-                    "jsonrpc": "2.0",
-                },
-                headers={"Content-Type": "application/json"},
-                timeout=10,
-            )
-            response = share_status_response.json()
-            if "result" in response and response["result"]:
+        self._latest = {"latitude": latitude, "longitude": longitude, "yaw": yaw}
+        self._ensure_worker().set()
+
+    def _ensure_worker(self) -> asyncio.Event:
+        """
+        Start the sender task if it is not already running.
+
+        Returns
+        -------
+        asyncio.Event
+            Event signalling that a new fix is waiting to be sent.
+        """
+        if self._pending is None:
+            self._pending = asyncio.Event()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run_sender())
+        return self._pending
+
+    async def _run_sender(self) -> None:
+        """
+        Send the most recent fix whenever one is pending.
+
+        At most one request is in flight and one fix is waiting, so a slow
+        link never builds up a backlog of stale coordinates.
+        """
+        assert self._pending is not None
+
+        while True:
+            await self._pending.wait()
+            self._pending.clear()
+            payload, self._latest = self._latest, None
+            if payload is None:
+                continue
+
+            if await self._post_status(payload):
                 logging.info("GPSFabricConnector: Coordinates shared successfully.")
             else:
                 logging.error("GPSFabricConnector: Failed to share coordinates.")
-                return None
-        except requests.RequestException as e:
-            logging.error(f"GPSFabricConnector: Error sending coordinates: {e}")
+
+    async def _post_status(self, payload: Dict[str, Any]) -> bool:
+        """
+        Send a coordinate payload to the Fabric network.
+
+        Parameters
+        ----------
+        payload : Dict[str, Any]
+            The status object passed to omp2p_shareStatus.
+
+        Returns
+        -------
+        bool
+            True if the Fabric network accepted the coordinates.
+        """
+        body = (
+            self._RPC_PREFIX
+            + json.dumps(payload, separators=(",", ":")).encode()
+            + self._RPC_SUFFIX
+        )
+        session = self._get_session()
+        response: Dict[str, Any] = {}
+        for attempt in range(self._MAX_RETRIES + 1):
+            # A newer fix supersedes this one, so stop retrying it
+            can_retry = attempt < self._MAX_RETRIES and self._latest is None
+            try:
+                async with session.post(
+                    f"{self.fabric_endpoint}", data=body
+                ) as share_status_response:
+                    if (
+                        share_status_response.status in self._RETRY_STATUSES
+                        and can_retry
+                    ):
+                        await asyncio.sleep(self._RETRY_BACKOFF * 2**attempt)
+                        continue
+                    response = json.loads(await share_status_response.read())
+                break
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if can_retry:
+                    await asyncio.sleep(self._RETRY_BACKOFF * 2**attempt)
+                    continue
+                logging.error(f"GPSFabricConnector: Error sending coordinates: {e}")
+                return False
+            except (aiohttp.ClientError, ValueError) as e:
+                logging.error(f"GPSFabricConnector: Error sending coordinates: {e}")
+                return False
+
+        return "result" in response and bool(response["result"])
+
+    async def aclose(self) -> None:
+        """
+        Stop the sender task and close the HTTP session.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,159 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from actions.gps.connector.fabric import GPSFabricConfig, GPSFabricConnector
+from actions.gps.interface import GPSAction, GPSInput
+
+
+@pytest.fixture
+def io_provider():
+    """Mock IOProvider with a fixed GPS fix."""
+    with patch("actions.gps.connector.fabric.IOProvider") as mock:
+        mock_instance = Mock()
+        mock_instance.get_dynamic_variable.side_effect = {
+            "latitude": 37.77,
+            "longitude": -122.42,
+            "yaw_deg": 90.0,
+        }.get
+        mock.return_value = mock_instance
+        yield mock_instance
+
+
+@pytest.fixture
+def connector(io_provider):
+    """Create GPSFabricConnector with mocked dependencies."""
+    return GPSFabricConnector(GPSFabricConfig(fabric_endpoint="http://fabric"))
+
+
+@pytest.mark.asyncio
+async def test_share_location_sends_latest_fix(connector):
+    """
+    Test that a share location action sends the current fix.
+    """
+    connector._post_status = AsyncMock(return_value=True)
+
+    await connector.connect(GPSInput(action=GPSAction.SHARE_LOCATION))
+    await asyncio.sleep(0)
+
+    connector._post_status.assert_awaited_once_with(
+        {"latitude": 37.77, "longitude": -122.42, "yaw": 90.0}
+    )
+
+    await connector.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stale_fixes_are_dropped(connector, io_provider):
+    """
+    Test that fixes queued behind an in-flight request collapse to the newest.
+    """
+    release = asyncio.Event()
+
+    async def slow_post(payload):
+        await release.wait()
+        return True
+
+    connector._post_status = AsyncMock(side_effect=slow_post)
+
+    await connector.send_coordinates()
+    await asyncio.sleep(0)
+    for latitude in (1.0, 2.0, 3.0):
+        io_provider.get_dynamic_variable.side_effect = {
+            "latitude": latitude,
+            "longitude": 0.0,
+            "yaw_deg": 0.0,
+        }.get
+        await connector.send_coordinates()
+
+    release.set()
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    sent = [call.args[0]["latitude"] for call in connector._post_status.await_args_list]
+    assert sent == [37.77, 3.0]
+
+    await connector.aclose()
+
+
+@pytest.mark.asyncio
+async def test_no_coordinates_skips_request(connector, io_provider):
+    """
+    Test that nothing is sent when no coordinates are available.
+    """
+    io_provider.get_dynamic_variable.side_effect = None
+    io_provider.get_dynamic_variable.return_value = None
+    connector._post_status = AsyncMock()
+
+    await connector.send_coordinates()
+    await asyncio.sleep(0)
+
+    connector._post_status.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_post_status_reads_result(connector):
+    """
+    Test that the JSON-RPC result decides whether sharing succeeded.
+    """
+    response = AsyncMock()
+    response.read.return_value = b'{"id":1,"result":true,"jsonrpc":"2.0"}'
+    post_context = AsyncMock()
+    post_context.__aenter__.return_value = response
+    session = Mock()
+    session.post.return_value = post_context
+
+    with patch.object(connector, "_get_session", return_value=session):
+        assert await connector._post_status({"latitude": 1.0})
+
+    body = json.loads(session.post.call_args.kwargs["data"])
+    assert body == {
+        "method": "omp2p_shareStatus",
+        "params": [{"latitude": 1.0}],
+        "id": 1,
+        "jsonrpc": "2.0",
+    }
+
+
+@pytest.mark.asyncio
+async def test_post_status_retries_gateway_errors(connector):
+    """
+    Test that a transient gateway error is retried before giving up.
+    """
+    unavailable = AsyncMock(status=503)
+    ok = AsyncMock(status=200)
+    ok.read.return_value = b'{"id":1,"result":true,"jsonrpc":"2.0"}'
+    contexts = []
+    for response in (unavailable, ok):
+        post_context = AsyncMock()
+        post_context.__aenter__.return_value = response
+        contexts.append(post_context)
+    session = Mock()
+    session.post.side_effect = contexts
+
+    with (
+        patch.object(connector, "_get_session", return_value=session),
+        patch("actions.gps.connector.fabric.asyncio.sleep", new=AsyncMock()),
+    ):
+        assert await connector._post_status({"latitude": 1.0})
+
+    assert session.post.call_count == 2
+    unavailable.read.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_post_status_rejects_malformed_response(connector):
+    """
+    Test that a non-JSON response is reported as a failure.
+    """
+    response = AsyncMock(status=200)
+    response.read.return_value = b"<html>Bad Gateway</html>"
+    post_context = AsyncMock()
+    post_context.__aenter__.return_value = response
+    session = Mock()
+    session.post.return_value = post_context
+
+    with patch.object(connector, "_get_session", return_value=session):
+        assert not await connector._post_status({"latitude": 1.0})